@@ -1,8 +1,5 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from scipy.stats import norm
-import re
+from engine import load_sheet_data, compute_opportunities
 
 # ==========================================
 # 🎨 CUSTOM STYLING (From your HTML file)
@@ -62,36 +59,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# ==========================================
-# 🏀 CONFIGURATION & LOGIC (The Brains)
-# ==========================================
-# PASTE YOUR GOOGLE SHEET CSV LINK HERE
-SHEET_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTZb3EzZ2pQUO1NttC8Wo3WRWY02_THxEmzcMESCN5Y4QCCAgI26WxWbfeyVvnTSWkYjv-Vd0yxtSmF/pub?gid=1128595491&single=true&output=csv"
-
-# --- HELPER FUNCTIONS ---
-def am_to_dec(odds):
-    try:
-        o = float(odds)
-        if o == 0: return 1.0
-        return (o / 100) + 1 if o > 0 else (100 / abs(o)) + 1
-    except: return 1.0
-
-def calc_edge(projection, line, odds):
-    try:
-        std_dev = projection * 0.20
-        z_score = (line - projection) / std_dev
-        true_prob = 1 - norm.cdf(z_score)
-        dec_odds = am_to_dec(odds)
-        implied_prob = 1 / dec_odds if dec_odds > 0 else 0
-        return true_prob, true_prob - implied_prob
-    except: return 0.0, 0.0
-
-@st.cache_data(ttl=300)
-def load_sheet_data():
-    try:
-        return pd.read_csv(SHEET_URL, header=None, on_bad_lines='skip')
-    except: return None
-
 # ==========================================
 # 📱 THE APP UI
 # ==========================================
@@ -131,68 +98,21 @@ with st.sidebar:
         st.caption("No bets staged.")
 
 # 3. LOGIC ENGINE
-betting_opportunities = []
-rows = df.values.tolist()
-
-for row in rows:
-    clean_row = [str(x) if pd.notna(x) else "" for x in row]
-    stat_col_idx = -1
-    for i in range(5):
-        if i < len(clean_row):
-            val = clean_row[i].strip()
-            if any(x in val for x in ['Points', 'Rebounds', 'Assists', '3 Pointer', 'Pts+']) and len(val) < 20:
-                stat_col_idx = i
-                break
-    
-    if stat_col_idx != -1:
-        label = clean_row[stat_col_idx]
-        history_idx = stat_col_idx + 1
-        if history_idx < len(clean_row):
-            history = clean_row[history_idx]
-            if "," in history:
-                try:
-                    past_games = [float(x.strip()) for x in history.split(',') if x.strip() and x.replace('.','',1).isdigit()]
-                    if not past_games: continue
-                    avg = sum(past_games) / len(past_games)
-                    projection = avg * defense_mult
-                    
-                    for i in range(history_idx + 1, len(clean_row)):
-                        cell_val = clean_row[i]
-                        if "/" in cell_val:
-                            parts = cell_val.split('/')
-                            try:
-                                line = float(re.findall(r'-?\d+\.?\d*', parts[0])[0])
-                                odds = float(re.findall(r'-?\d+\.?\d*', parts[1])[0])
-                                prob, edge = calc_edge(projection, line, odds)
-                                
-                                if edge > 0.02:
-                                    rec = "🚨 HAMMER" if edge > 0.15 else ("✅ BET" if edge > 0.05 else "⚖️ PASS")
-                                    betting_opportunities.append({
-                                        "Player Stat": label,
-                                        "Line": line,
-                                        "Odds": int(odds),
-                                        "Proj": round(projection, 1),
-                                        "Win%": f"{int(prob*100)}%",
-                                        "Edge": f"{int(edge*100)}%",
-                                        "Verdict": rec,
-                                        "Raw_Edge": edge
-                                    })
-                            except: continue
-                except: continue
+# Cached on (sheet, defense_mult), so ticket clicks don't re-run the engine
+res_df = compute_opportunities(df, defense_mult)
 
 # 4. DISPLAY RESULTS
-if not betting_opportunities:
+if res_df.empty:
     st.info("No high-value edges found right now.")
 else:
     # Top Metrics Row
     col1, col2, col3 = st.columns(3)
-    best_bet = max(betting_opportunities, key=lambda x: x['Raw_Edge'])
+    best_bet = res_df.iloc[0]
     col1.metric("Top Edge Found", best_bet['Edge'], best_bet['Player Stat'])
-    col2.metric("Total Opportunities", len(betting_opportunities))
+    col2.metric("Total Opportunities", len(res_df))
     col3.metric("System Status", "Online 🟢")
 
     st.markdown("### 📋 Analysis Board")
-    res_df = pd.DataFrame(betting_opportunities).sort_values(by="Raw_Edge", ascending=False).drop(columns=["Raw_Edge"])
     
     st.dataframe(
         res_df,
@@ -205,7 +125,7 @@ else:
     
     st.markdown("---")
     st.subheader("Add to Ticket")
-    opts = res_df.apply(lambda x: f"{x['Player Stat']} {x['Line']}+ ({x['Odds']})", axis=1).tolist()
+    opts = (res_df['Player Stat'].astype(str) + ' ' + res_df['Line'].astype(str) + '+ (' + res_df['Odds'].astype(str) + ')').tolist()
     sel = st.selectbox("Select Leg:", opts)
     if st.button("Add Leg"):
         st.session_state.ticket.append(sel)
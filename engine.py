@@ -0,0 +1,118 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from scipy.special import ndtr
+import re
+
+# ==========================================
+# 🏀 CONFIGURATION & LOGIC (The Brains)
+# ==========================================
+# PASTE YOUR GOOGLE SHEET CSV LINK HERE
+SHEET_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTZb3EzZ2pQUO1NttC8Wo3WRWY02_THxEmzcMESCN5Y4QCCAgI26WxWbfeyVvnTSWkYjv-Vd0yxtSmF/pub?gid=1128595491&single=true&output=csv"
+
+# Alt-line cells look like "25.5 / -110" -> (line, american odds); tolerates "22.5+ / +150", "6.5 / (-115)"
+_PAIR_RE = re.compile(r'(-?\d+\.?\d*)[^/\d-]*/[^\d-]*(-?\d+\.?\d*)')
+
+# One game value in a history cell like "22, 18, DNP, 25"
+_NUM_RE = re.compile(r'-?\d+\.?\d*')
+
+# A leading cell naming one of these marks a player-stat row
+_STAT_KEYWORDS = ('Points', 'Rebounds', 'Assists', '3 Pointer', 'Pts+')
+_STAT_RE = re.compile('|'.join(map(re.escape, _STAT_KEYWORDS)))
+
+# --- HELPER FUNCTIONS ---
+def am_to_dec(odds):
+    # Closed form for a number (-> float) or an array of numbers; non-numeric input raises.
+    # 0 isn't a real price so it maps to 1.0 (no edge)
+    o = np.asarray(odds, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        dec = np.where(o > 0, o * 0.01 + 1, np.where(o < 0, 1 - 100 / o, 1.0))
+    return float(dec) if dec.ndim == 0 else dec
+
+def _edges(projection, lines_arr, odds_arr):
+    # projection may be a scalar or one value per line; 1/std is worked out once either way
+    # P(over) = 1 - cdf(z) = ndtr(-z), so feed ndtr the negated z-score directly
+    inv_std = 1.0 / (projection * 0.20)
+    probs = ndtr((projection - lines_arr) * inv_std)
+    return probs, probs - 1 / am_to_dec(odds_arr)
+
+def _parse_history(history):
+    # Keeps the numeric tokens and skips the rest ("DNP", blanks), like the old isdigit filter
+    return np.array([float(t) for t in (x.strip() for x in history.split(',')) if _NUM_RE.fullmatch(t)], dtype=np.float64)
+
+@st.cache_data(ttl=300, show_spinner="📡 Pulling the latest lines...")
+def load_sheet_data():
+    try:
+        # Everything is parsed as text downstream; short rows still pad with NaN, hence fillna
+        return pd.read_csv(SHEET_URL, header=None, dtype=str, engine='c', on_bad_lines='skip', keep_default_na=False).fillna('')
+    except: return None
+
+# Bounded like load_sheet_data: the live sheet plus the one it just replaced
+@st.cache_data(ttl=300, max_entries=2)
+def parse_sheet(df):
+    # Flattens the sheet into arrays so reruns only redo the edge math:
+    # labels/avg are per sheet row (avg is NaN without usable history),
+    # lines/odds/row_id have one entry per alt line
+
+    # Find each row's stat label (first hit in the leading 5 columns) in one vectorized regex pass
+    lead = df.iloc[:, :5]
+    label_mask = lead.apply(lambda s: s.str.strip().str.len().lt(20) & s.str.contains(_STAT_RE))
+    stat_cols = np.where(label_mask.any(axis=1), label_mask.to_numpy().argmax(axis=1), -1)
+
+    # Pull every "line / odds" cell out of the sheet in one vectorized extract (row-major order)
+    tail = df.iloc[:, 2:]
+    pairs = pd.Series(tail.to_numpy().ravel(), dtype=object).str.extract(_PAIR_RE).dropna().astype(np.float64)
+    pairs = pairs[pairs[1] != 0]
+    # Sheets narrower than 3 columns have no alt-line cells; max() keeps divmod defined
+    pair_rows, pair_cols = np.divmod(pairs.index.to_numpy(), max(tail.shape[1], 1))
+    pair_cols += 2
+
+    labels = np.full(len(df), "", dtype=object)
+    avg = np.full(len(df), np.nan)
+    n_cols = df.shape[1]
+    cells = df.to_numpy()
+    # Only labelled rows are visited, and only their label and history cells are read
+    for r in np.flatnonzero(stat_cols != -1):
+        stat_col_idx = stat_cols[r]
+        history_idx = stat_col_idx + 1
+        if history_idx < n_cols:
+            history = cells[r, history_idx]
+            if "," in history:
+                past_games = _parse_history(history)
+                if past_games.size == 0: continue
+                labels[r] = cells[r, stat_col_idx]
+                avg[r] = past_games.mean()
+
+    # A row's alt lines are the pairs to the right of its history cell; rows without a
+    # positive average can't be projected (NaN compares False, so they drop out too)
+    keep = (stat_cols[pair_rows] != -1) & (pair_cols > stat_cols[pair_rows] + 1) & (avg[pair_rows] > 0)
+    return {
+        "labels": labels,
+        "avg": avg,
+        "lines": pairs[0].to_numpy()[keep],
+        "odds": pairs[1].to_numpy()[keep],
+        "row_id": pair_rows[keep].astype(np.int32),
+    }
+
+# 3 matchup settings x (live sheet + the one it just replaced)
+@st.cache_data(ttl=300, max_entries=6, show_spinner="🔎 Scanning the board for edges...")
+def compute_opportunities(df, defense_mult):
+    # Only the edge math depends on the matchup dropdown; parsing comes from cache
+    sheet = parse_sheet(df)
+    row_id = sheet["row_id"]
+    projection = sheet["avg"][row_id] * defense_mult
+    probs, edges = _edges(projection, sheet["lines"], sheet["odds"])
+
+    # Keep the results column-wise and sort once on the contiguous edge array
+    order = np.flatnonzero(edges > 0.02)
+    order = order[np.argsort(-edges[order], kind='stable')]
+    top_edges = edges[order]
+    return pd.DataFrame({
+        "Player Stat": sheet["labels"][row_id[order]],
+        "Line": sheet["lines"][order],
+        "Odds": sheet["odds"][order].astype(int),
+        "Proj": projection[order].round(1),
+        "Win%": np.char.add((probs[order] * 100).astype(int).astype(str), "%"),
+        "Edge": np.char.add((top_edges * 100).astype(int).astype(str), "%"),
+        "Verdict": np.where(top_edges > 0.15, "🚨 HAMMER", np.where(top_edges > 0.05, "✅ BET", "⚖️ PASS")),
+    })
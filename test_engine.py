@@ -0,0 +1,57 @@
+import io
+
+import pandas as pd
+import pytest
+
+from engine import _PAIR_RE, _parse_history, compute_opportunities
+
+
+def _sheet(csv):
+    # Same read options as load_sheet_data, minus the network
+    return pd.read_csv(io.StringIO(csv), header=None, dtype=str, keep_default_na=False).fillna('')
+
+
+@pytest.mark.parametrize("history, expected", [
+    ("10,DNP,12,8", [10.0, 12.0, 8.0]),
+    ("5,,6", [5.0, 6.0]),
+    (",", []),
+    ("25,30 (avg)", [25.0]),
+    ("22, 18.5, 25", [22.0, 18.5, 25.0]),
+])
+def test_parse_history_skips_non_numeric_tokens(history, expected):
+    assert _parse_history(history).tolist() == expected
+
+
+def test_junk_in_history_still_prices_the_row():
+    res = compute_opportunities(_sheet('Joe,Points,"10,DNP,12,8",9.5 / -110'), 1.0)
+    assert res["Line"].tolist() == [9.5]
+    assert res["Proj"].tolist() == [10.0]
+
+
+@pytest.mark.parametrize("cell, odds", [
+    ("20.5 / -110", -110),
+    ("20.5 / +150", 150),
+    ("20.5+ / -110", -110),
+    ("20.5 / (-110)", -110),
+    ("O 20.5 / -110", -110),
+    ("20.5 / odds -110", -110),
+])
+def test_alt_line_formats_are_priced(cell, odds):
+    assert [float(g) for g in _PAIR_RE.search(cell).groups()] == [20.5, odds]
+    res = compute_opportunities(_sheet(f'Joe,Points,"30,30,30",{cell}'), 1.0)
+    assert res["Line"].tolist() == [20.5]
+    assert res["Odds"].tolist() == [odds]
+
+
+@pytest.mark.parametrize("csv", ["Points", "Joe,Points", 'Joe,Points\nAnn,Rebounds'])
+def test_sheet_too_narrow_for_alt_lines_finds_nothing(csv):
+    assert compute_opportunities(_sheet(csv), 1.0).empty
+
+
+def test_results_sorted_by_edge_with_verdict_tiers():
+    # Projection 20 at -110: 15.5 is a ~34% edge, 18.5 ~12%, 19.5 ~2.6%, 21.5 has none
+    res = compute_opportunities(_sheet('Joe,Points,"20,20,20",19.5 / -110,21.5 / -110,15.5 / -110,18.5 / -110'), 1.0)
+    assert res["Line"].tolist() == [15.5, 18.5, 19.5]
+    assert res["Verdict"].tolist() == ["🚨 HAMMER", "✅ BET", "⚖️ PASS"]
+    assert res["Edge"].tolist() == ["34%", "12%", "2%"]
+    assert res["Proj"].tolist() == [20.0] * 3